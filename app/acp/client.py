@@ -7,6 +7,8 @@ operations to the actual OS, making it suitable for fully autonomous operation.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import fcntl
 import logging
 import os
 import subprocess
@@ -57,29 +59,97 @@ SessionUpdate = (
 
 UpdateCallback = Callable[[str, SessionUpdate], Coroutine[Any, Any, None]]
 
+# Read terminal output in large chunks to cut syscalls and event loop wakeups
+TERMINAL_READ_SIZE = 256 * 1024
+# Kernel pipe buffer for terminal stdout, so bursty commands don't block on write()
+TERMINAL_PIPE_SIZE = 1024 * 1024
+
 
 class _Terminal:
     """Tracks a running subprocess terminal."""
 
-    def __init__(self, proc: Process, terminal_id: str):
+    def __init__(
+        self,
+        proc: Process,
+        terminal_id: str,
+        stdout: asyncio.StreamReader,
+        stdout_transport: asyncio.ReadTransport,
+    ):
         self.proc = proc
         self.terminal_id = terminal_id
-        self.output = ""
+        self._stdout = stdout
+        self._stdout_transport = stdout_transport
+        self._chunks: list[bytes] = []
+        self._joined_cache: str | None = None
         self._read_task: asyncio.Task[None] | None = None
 
+    @property
+    def output(self) -> str:
+        """Output captured so far, decoded lazily and cached until the next chunk.
+
+        Raw bytes are joined before decoding so multi-byte UTF-8 sequences that
+        straddle a read boundary are decoded intact.
+        """
+        if self._joined_cache is None:
+            self._joined_cache = b"".join(self._chunks).decode("utf-8", errors="replace")
+        return self._joined_cache
+
     async def start_reading(self) -> None:
         self._read_task = asyncio.create_task(self._read_loop())
 
     async def _read_loop(self) -> None:
-        assert self.proc.stdout is not None
         try:
             while True:
-                chunk = await self.proc.stdout.read(4096)
+                chunk = await self._stdout.read(TERMINAL_READ_SIZE)
                 if not chunk:
                     break
-                self.output += chunk.decode("utf-8", errors="replace")
+                self._chunks.append(chunk)
+                self._joined_cache = None
         except Exception:
             pass
+        finally:
+            self._stdout_transport.close()
+
+
+def _stdout_pipe() -> tuple[int, int]:
+    """Create the terminal's stdout pipe, grown to TERMINAL_PIPE_SIZE where supported.
+
+    Returns ``(read_fd, write_fd)``. Resizing is Linux-only and best effort.
+    """
+    read_fd, write_fd = os.pipe()
+    if hasattr(fcntl, "F_SETPIPE_SZ"):
+        with contextlib.suppress(OSError):
+            fcntl.fcntl(write_fd, fcntl.F_SETPIPE_SZ, TERMINAL_PIPE_SIZE)
+    return read_fd, write_fd
+
+
+def _write_file(p: Path, data: bytes) -> None:
+    """Write raw bytes to ``p``, creating parent directories as needed."""
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(data)
+
+
+def _read_file(p: Path, line: int | None, limit: int | None) -> str:
+    """Read ``p`` as UTF-8, optionally only ``limit`` lines starting at 1-indexed ``line``."""
+    text = p.read_text(encoding="utf-8")
+    if line is None:
+        return text
+
+    # Locate the window with C-level str.find and return one slice, no per-line strings
+    start = _skip_lines(text, 0, max(0, line - 1))
+    if limit is None:
+        return text[start:]
+    return text[start : _skip_lines(text, start, limit)]
+
+
+def _skip_lines(text: str, pos: int, count: int) -> int:
+    """Return the offset just past ``count`` newlines from ``pos`` (or ``len(text)``)."""
+    for _ in range(count):
+        pos = text.find("\n", pos)
+        if pos == -1:
+            return len(text)
+        pos += 1
+    return pos
 
 
 class BridgeAcpClient:
@@ -91,6 +161,8 @@ class BridgeAcpClient:
     def __init__(self, on_update: UpdateCallback | None = None):
         self._on_update = on_update
         self._terminals: dict[str, _Terminal] = {}
+        # Snapshot once; terminals only overlay their own vars on top of it
+        self._base_env = os.environ.copy()
 
     # --- Permission handling: auto-approve everything ---
 
@@ -136,9 +208,8 @@ class BridgeAcpClient:
     async def write_text_file(
         self, content: str, path: str, session_id: str, **kwargs: Any
     ) -> WriteTextFileResponse | None:
-        p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content, encoding="utf-8")
+        # Encode once on the loop; the blocking mkdir + write run in a worker thread
+        await asyncio.to_thread(_write_file, Path(path), content.encode("utf-8"))
         return WriteTextFileResponse()
 
     async def read_text_file(
@@ -149,18 +220,7 @@ class BridgeAcpClient:
         line: int | None = None,
         **kwargs: Any,
     ) -> ReadTextFileResponse:
-        p = Path(path)
-        text = p.read_text(encoding="utf-8")
-
-        if line is not None:
-            lines = text.splitlines(keepends=True)
-            start = max(0, line - 1)  # 1-indexed
-            if limit is not None:
-                lines = lines[start : start + limit]
-            else:
-                lines = lines[start:]
-            text = "".join(lines)
-
+        text = await asyncio.to_thread(_read_file, Path(path), line, limit)
         return ReadTextFileResponse(content=text)
 
     # --- Terminal operations: delegate to subprocess ---
@@ -177,21 +237,35 @@ class BridgeAcpClient:
     ) -> CreateTerminalResponse:
         terminal_id = str(uuid.uuid4())
 
-        proc_env = dict(os.environ)
-        if env:
-            for var in env:
-                proc_env[var.name] = var.value
-
-        proc = await asyncio.create_subprocess_exec(
-            command,
-            *(args or []),
-            cwd=cwd,
-            env=proc_env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
+        proc_env = (
+            {**self._base_env, **{var.name: var.value for var in env}} if env else self._base_env
+        )
+
+        # Our own pipe rather than subprocess.PIPE, so it can be resized before use
+        read_fd, write_fd = _stdout_pipe()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                command,
+                *(args or []),
+                cwd=cwd,
+                env=proc_env,
+                stdout=write_fd,
+                stderr=subprocess.STDOUT,
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            # The child holds its own copy; ours must go so EOF arrives when it exits
+            os.close(write_fd)
+
+        loop = asyncio.get_running_loop()
+        stdout = asyncio.StreamReader(limit=10 * 1024 * 1024)  # 10MB buffer, matching AcpSession
+        stdout_transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(stdout), os.fdopen(read_fd, "rb", buffering=0)
         )
 
-        terminal = _Terminal(proc, terminal_id)
+        terminal = _Terminal(proc, terminal_id, stdout, stdout_transport)
         await terminal.start_reading()
         self._terminals[terminal_id] = terminal
 
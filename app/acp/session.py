@@ -62,6 +62,7 @@ class AcpSession:
         if self._extra_env:
             proc_env = {**os.environ, **self._extra_env}
 
+        self._client = BridgeAcpClient(on_update=self._on_update)
         self._proc = await asyncio.create_subprocess_exec(
             self._command,
             stdin=subprocess.PIPE,
@@ -74,7 +75,6 @@ class AcpSession:
         if self._proc.stdin is None or self._proc.stdout is None:
             raise RuntimeError("Agent process does not expose stdio pipes")
 
-        self._client = BridgeAcpClient(on_update=self._on_update)
         self._conn = connect_to_agent(self._client, self._proc.stdin, self._proc.stdout)
 
         init_response = await self._conn.initialize(
@@ -93,21 +93,14 @@ class AcpSession:
             self._supports_load_session = True
 
         if resume_session_id:
-            # Resume existing session with full conversation history
-            if self._supports_load_session:
-                # codex-acp uses session/load
-                await self._conn.load_session(
-                    session_id=resume_session_id,
-                    cwd=cwd,
-                    mcp_servers=[],
-                )
-            else:
-                # claude-code-acp uses session/resume
-                await self._conn.resume_session(
-                    session_id=resume_session_id,
-                    cwd=cwd,
-                    mcp_servers=[],
-                )
+            # Resume existing session with full conversation history:
+            # codex-acp uses session/load, claude-code-acp uses session/resume
+            resume_fn = (
+                self._conn.load_session
+                if self._supports_load_session
+                else self._conn.resume_session
+            )
+            await resume_fn(session_id=resume_session_id, cwd=cwd, mcp_servers=[])
             self._session_id = resume_session_id
             logger.info("ACP session resumed: %s (cwd=%s)", self._session_id, cwd)
         else:
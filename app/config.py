@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import os
+from functools import cached_property, lru_cache
+from typing import Any
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
@@ -14,8 +16,18 @@ class AgentConfig(BaseModel):
     default: bool = False  # Is this the default agent?
 
 
+@lru_cache
+def _agent_env_var(var_name: str, agent_name: str) -> str:
+    """Env var name for an agent-specific override, e.g. SLACK_BOT_TOKEN__CODEX."""
+    return f"{var_name}__{agent_name}".upper()
+
+
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """Application settings loaded from environment variables.
+
+    Derived values (parsed JSON, split lists, decoded keys) are computed once via
+    ``cached_property`` since settings don't change after construction.
+    """
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
@@ -52,16 +64,16 @@ class Settings(BaseSettings):
     github_webhook_secret: str = ""
     github_bot_login: str = ""  # Optional fallback if auto-detect fails
 
-    @property
+    @cached_property
     def github_private_key_bytes(self) -> bytes:
         """Convert the PEM key string (with escaped newlines) to bytes."""
         return self.github_private_key.replace("\\n", "\n").encode("utf-8")
 
-    @property
-    def enabled_services_list(self) -> list[str]:
-        return [s.strip() for s in self.enabled_services.split(",") if s.strip()]
+    @cached_property
+    def enabled_services_list(self) -> tuple[str, ...]:
+        return tuple(s.strip() for s in self.enabled_services.split(",") if s.strip())
 
-    @property
+    @cached_property
     def agents(self) -> dict[str, AgentConfig]:
         """Parse agent registry from JSON config.
 
@@ -72,7 +84,7 @@ class Settings(BaseSettings):
         raw = json.loads(self.agents_json)
         return {name: AgentConfig(**cfg) for name, cfg in raw.items()}
 
-    @property
+    @cached_property
     def default_agent_name(self) -> str:
         """Return the name of the default agent."""
         for name, cfg in self.agents.items():
@@ -92,19 +104,46 @@ class Settings(BaseSettings):
         For the default agent, uses the base env var (e.g. SLACK_BOT_TOKEN).
         For other agents, checks SLACK_BOT_TOKEN__CODEX first, falls back to base.
         """
+        value = self.get_agent_credentials(agent_name).get(var_name.upper())
+        # Non-string settings (e.g. GITHUB_INSTALLATION_ID) come back as strings, and
+        # their unset defaults as ""
+        return str(value) if value else ""
+
+    def get_agent_credentials(self, agent_name: str) -> dict[str, Any]:
+        """All credentials for an agent, keyed by env var name, with overrides applied."""
+        creds = self._agent_credentials.get(agent_name)
+        if creds is not None:
+            return creds
+        # Agent not in the registry (e.g. restored from an older config)
         if agent_name == self.default_agent_name:
-            return getattr(self, var_name.lower(), "")
+            return self._credential_map
+        return self._resolve_overrides(agent_name)
 
-        # Check for agent-specific override (e.g. SLACK_BOT_TOKEN__CODEX)
-        suffixed = f"{var_name}__{agent_name}".upper()
-        value = os.environ.get(suffixed, "")
-        if value:
-            return value
+    @cached_property
+    def _credential_map(self) -> dict[str, Any]:
+        """Base setting values keyed by their upper-case env var name."""
+        return {name.upper(): getattr(self, name) for name in type(self).model_fields}
 
-        # Fall back to base
-        return getattr(self, var_name.lower(), "")
+    @cached_property
+    def _agent_credentials(self) -> dict[str, dict[str, Any]]:
+        """Resolved credentials for every registered agent.
 
-    @property
+        The default agent uses the base values; others get their overrides applied.
+        """
+        default = self.default_agent_name
+        return {
+            name: self._credential_map if name == default else self._resolve_overrides(name)
+            for name in self.agents
+        }
+
+    def _resolve_overrides(self, agent_name: str) -> dict[str, Any]:
+        """Base credentials with the agent's overrides (e.g. SLACK_BOT_TOKEN__CODEX) applied."""
+        return {
+            var_name: os.environ.get(_agent_env_var(var_name, agent_name), "") or value
+            for var_name, value in self._credential_map.items()
+        }
+
+    @cached_property
     def parsed_slack_channel_repos(self) -> dict[str, str]:
         """Parse SLACK_CHANNEL_REPOS JSON into a channel_id -> repo mapping.
 
@@ -120,7 +159,7 @@ class Settings(BaseSettings):
         except (json.JSONDecodeError, TypeError):
             return {}
 
-    @property
+    @cached_property
     def parsed_slack_channel_prompts(self) -> dict[str, str]:
         """Parse SLACK_CHANNEL_PROMPTS JSON into a channel_id -> prompt mapping."""
         if not self.slack_channel_prompts:
@@ -6,8 +6,10 @@ follow-ups, cancellations, and cleanup.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -18,12 +20,40 @@ from app.core.repo_provider import RepoProvider
 from app.core.types import BridgeSessionRequest, BridgeUpdate, ServiceAdapter
 from app.core.update_router import UpdateRouter
 
-_VIEWER_URL_TEMPLATE = "{base_url}/sessions/{session_id}"
+# Viewer URLs are "<base_url>/sessions/<session_id>"; empty when no base URL is set
+_VIEWER_URL_PREFIX = (
+    f"{settings.bridge_base_url.rstrip('/')}/sessions/" if settings.bridge_base_url else ""
+)
+
+# How long to wait for more session changes before persisting
+SAVE_DEBOUNCE_INTERVAL = 1.0  # seconds
+# Compact the session log once it holds this many times more records than sessions
+LOG_COMPACT_RATIO = 2
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _build_session_url(acp_session_id: str) -> str:
+    """Build a viewer URL for the given ACP session, or return empty string."""
+    if not _VIEWER_URL_PREFIX:
+        return ""
+    return _VIEWER_URL_PREFIX + acp_session_id
+
+
+# Persisted scalar fields and their defaults (None = required in persisted data)
+_PERSIST_FIELDS: dict[str, Any] = {
+    "external_session_id": None,
+    "service_name": None,
+    "acp_session_id": None,
+    "cwd": None,
+    "branch_name": "",
+    "agent_name": "",
+    "github_repo": "",
+    "github_installation_id": 0,
+}
+
+
+@dataclass(slots=True)
 class ActiveSession:
     """Tracks an active bridge session."""
 
@@ -39,19 +69,11 @@ class ActiveSession:
     service_metadata: dict[str, Any] | None = None  # Adapter-specific state
     github_repo: str = ""  # Repo used for this session (for follow-ups)
     github_installation_id: int = 0  # Installation ID used (for follow-ups)
+    session_url: str = ""  # Viewer URL, derived from acp_session_id (not persisted)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize session metadata to dict (excluding runtime objects)."""
-        data: dict[str, Any] = {
-            "external_session_id": self.external_session_id,
-            "service_name": self.service_name,
-            "acp_session_id": self.acp_session_id,
-            "cwd": self.cwd,
-            "branch_name": self.branch_name,
-            "agent_name": self.agent_name,
-            "github_repo": self.github_repo,
-            "github_installation_id": self.github_installation_id,
-        }
+        data = {name: getattr(self, name) for name in _PERSIST_FIELDS}
         if self.service_metadata:
             data["service_metadata"] = self.service_metadata
         return data
@@ -60,18 +82,14 @@ class ActiveSession:
     def from_dict(cls, data: dict[str, Any], adapter: ServiceAdapter) -> ActiveSession:
         """Restore session from persisted metadata (without active ACP session)."""
         return cls(
-            external_session_id=data["external_session_id"],
-            service_name=data["service_name"],
             adapter=adapter,
             acp_session=None,  # Will be created when needed
             update_router=None,  # Will be created when needed
-            acp_session_id=data["acp_session_id"],
-            cwd=data["cwd"],
-            branch_name=data.get("branch_name", ""),
-            agent_name=data.get("agent_name", ""),
             service_metadata=data.get("service_metadata"),
-            github_repo=data.get("github_repo", ""),
-            github_installation_id=data.get("github_installation_id", 0),
+            **{
+                name: data.get(name, default) if default is not None else data[name]
+                for name, default in _PERSIST_FIELDS.items()
+            },
         )
 
 
@@ -81,76 +99,242 @@ class SessionManager:
     def __init__(
         self,
         repo_provider: RepoProvider,
-        persistence_file: Path = Path("/var/lib/bridge/sessions.json"),
+        persistence_file: Path = Path("/var/lib/bridge/sessions.jsonl"),
     ) -> None:
         self._repo_provider = repo_provider
         self._active_sessions: dict[str, ActiveSession] = {}
+        # Same sessions indexed by service name, kept in step by _track/_untrack
+        self._by_service: dict[str, dict[str, ActiveSession]] = {}
+        # Restored sessions not yet needed: metadata and adapter, materialized into
+        # _active_sessions on first use
+        self._lazy_sessions: dict[str, tuple[dict[str, Any], ServiceAdapter]] = {}
+        # Append-only log of session upserts/deletes, compacted as it grows
         self._persistence_file = persistence_file
         self._persisted_metadata: dict[str, Any] = {}
-        self._load_sessions()
-
-    def _build_session_url(self, acp_session_id: str) -> str:
-        """Build a viewer URL for the given ACP session, or return empty string."""
-        if not settings.bridge_base_url:
-            return ""
-        base = settings.bridge_base_url.rstrip("/")
-        return _VIEWER_URL_TEMPLATE.format(base_url=base, session_id=acp_session_id)
+        self._persisted_by_service_type: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        # Serialized form of each tracked session as last written, and the IDs whose
+        # entry needs rebuilding (or dropping) on the next save
+        self._snapshot: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+        # Records currently in the log, and whether the next save must rewrite it
+        self._log_records = 0
+        self._compact_next = False
+        self._save_handle: asyncio.TimerHandle | None = None
+        self._save_task: asyncio.Task[None] | None = None
+        self._save_lock = asyncio.Lock()
+
+    async def initialize(self) -> None:
+        """Load persisted session metadata, reading and parsing it in a worker thread.
+
+        Must be awaited before adapters restore their sessions.
+        """
+        await asyncio.to_thread(self._load_sessions)
 
     def _load_sessions(self) -> None:
         """Load persisted session metadata from disk.
 
+        Replays the session log; falls back to the single-JSON snapshot format used
+        before the log existed (the next save then rewrites it as a log).
+
         Note: This only restores the metadata. Active ACP sessions and adapters
         are not restored - they will be recreated on first follow-up.
         """
-        if not self._persistence_file.exists():
-            logger.info("No persisted sessions file found at %s", self._persistence_file)
-            return
-
+        legacy_file = self._persistence_file.with_suffix(".json")
         try:
-            with open(self._persistence_file) as f:
-                data = json.load(f)
+            if self._persistence_file.exists():
+                source = self._persistence_file
+                sessions = self._replay_log()
+            elif legacy_file.exists():
+                source = legacy_file
+                sessions = json.loads(legacy_file.read_bytes()).get("sessions", {})
+                self._compact_next = True
+            else:
+                logger.info("No persisted sessions file found at %s", self._persistence_file)
+                return
 
             # We can't fully restore sessions without adapters, so just log what we found
-            session_count = len(data.get("sessions", {}))
-            if session_count > 0:
+            if sessions:
                 logger.info(
                     "Found %d persisted session(s) in %s. Sessions will be available "
                     "for resumption when services reconnect.",
-                    session_count,
-                    self._persistence_file,
+                    len(sessions),
+                    source,
                 )
-                # Store the raw data for later use when adapters reconnect
-                self._persisted_metadata = data.get("sessions", {})
-            else:
-                self._persisted_metadata = {}
+                # Store the raw data for later use when adapters reconnect, grouped
+                # by service type ("slack" for "slack:default") for restore lookups
+                self._persisted_metadata = sessions
+                for external_id, metadata in sessions.items():
+                    service_type = metadata["service_name"].split(":")[0]
+                    self._persisted_by_service_type.setdefault(service_type, []).append(
+                        (external_id, metadata)
+                    )
         except Exception:
             logger.exception("Failed to load persisted sessions from %s", self._persistence_file)
             self._persisted_metadata = {}
+            self._persisted_by_service_type = {}
+
+    def _replay_log(self) -> dict[str, Any]:
+        """Rebuild the persisted sessions by replaying the log's records in order."""
+        sessions: dict[str, Any] = {}
+        for line in self._persistence_file.read_bytes().splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn append from a crash; rewrite the log rather than append after it
+                logger.warning("Skipping unreadable record in %s", self._persistence_file)
+                self._compact_next = True
+                continue
+            self._log_records += 1
+            if record["op"] == "upsert":
+                sessions[record["id"]] = record["session"]
+            else:
+                sessions.pop(record["id"], None)
+        return sessions
+
+    def _track(self, active: ActiveSession) -> None:
+        """Start tracking a session under its external ID and service name."""
+        self._lazy_sessions.pop(active.external_session_id, None)
+        if active.external_session_id in self._active_sessions:
+            self._untrack(active.external_session_id)
+        self._active_sessions[active.external_session_id] = active
+        self._by_service.setdefault(active.service_name, {})[active.external_session_id] = active
+
+    def _untrack(self, external_session_id: str) -> None:
+        """Stop tracking a session."""
+        active = self._active_sessions.pop(external_session_id)
+        service_sessions = self._by_service[active.service_name]
+        del service_sessions[external_session_id]
+        if not service_sessions:
+            del self._by_service[active.service_name]
+
+    def _get_session(self, external_session_id: str) -> ActiveSession | None:
+        """Look up a tracked session, materializing it if it was restored lazily."""
+        active = self._active_sessions.get(external_session_id)
+        if active is None and external_session_id in self._lazy_sessions:
+            metadata, adapter = self._lazy_sessions.pop(external_session_id)
+            active = ActiveSession.from_dict(metadata, adapter)
+            # Use the adapter's service_name so get_sessions_for_service() matches
+            active.service_name = adapter.service_name
+            self._track(active)
+        return active
+
+    def touch(
+        self, external_session_id: str, service_metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Mark a session changed so its record is rewritten on the next save.
+
+        Adapters call this after mutating a session's service metadata in place, or
+        pass ``service_metadata`` to replace it.
+        """
+        active = self._get_session(external_session_id)
+        if active is not None:
+            if service_metadata is not None:
+                active.service_metadata = service_metadata
+            self._dirty.add(external_session_id)
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Persist session metadata soon, coalescing bursts of changes into one write."""
+        if self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(
+                SAVE_DEBOUNCE_INTERVAL, self._on_save_timer
+            )
+
+    def _on_save_timer(self) -> None:
+        self._save_handle = None
+        self._save_task = asyncio.create_task(self._save_sessions_async())
+
+    async def _save_sessions_async(self) -> None:
+        """Persist session metadata, writing the file in a worker thread."""
+        async with self._save_lock:
+            serialized = self._serialize_sessions()
+            if serialized is not None and not await asyncio.to_thread(
+                self._write_sessions, *serialized
+            ):
+                # The log may now be missing records; rewrite it in full, soon
+                self._compact_next = True
+                self._schedule_save()
 
     def _save_sessions(self) -> None:
-        """Persist current session metadata to disk."""
-        try:
-            # Ensure parent directory exists
-            self._persistence_file.parent.mkdir(parents=True, exist_ok=True)
+        """Persist current session metadata to disk, blocking until written."""
+        serialized = self._serialize_sessions()
+        if serialized is not None and not self._write_sessions(*serialized):
+            self._compact_next = True
+
+    def _serialize_sessions(self) -> tuple[bytes, bool] | None:
+        """Serialize pending session changes, or return None when nothing changed.
+
+        Returns the log records to write and whether they replace the whole log
+        (compaction, once it holds LOG_COMPACT_RATIO times more records than live
+        sessions) rather than being appended. Runs on the event loop so adapters
+        can't mutate service metadata mid-dump.
+        """
+        if not self._dirty and not self._compact_next:
+            return None
+
+        records = []
+        for external_id in self._dirty:
+            session = self._active_sessions.get(external_id)
+            if session is None:
+                self._snapshot.pop(external_id, None)
+                records.append({"op": "delete", "id": external_id})
+            else:
+                self._snapshot[external_id] = session.to_dict()
+                records.append(
+                    {"op": "upsert", "id": external_id, "session": self._snapshot[external_id]}
+                )
+        self._dirty.clear()
+        self._log_records += len(records)
 
-            sessions_data = {
-                external_id: session.to_dict()
-                for external_id, session in self._active_sessions.items()
-            }
+        compact = self._compact_next or self._log_records > LOG_COMPACT_RATIO * max(
+            len(self._snapshot), 1
+        )
+        if compact:
+            records = [
+                {"op": "upsert", "id": external_id, "session": session}
+                for external_id, session in self._snapshot.items()
+            ]
+            self._log_records = len(records)
+            self._compact_next = False
+
+        payload = b"".join(
+            json.dumps(record, separators=(",", ":")).encode() + b"\n" for record in records
+        )
+        return payload, compact
 
-            data = {"sessions": sessions_data}
+    def _write_sessions(self, payload: bytes, replace: bool) -> bool:
+        """Append ``payload`` to the session log, or atomically replace the log with it.
 
-            # Write atomically using a temp file
-            temp_file = self._persistence_file.with_suffix(".tmp")
-            with open(temp_file, "w") as f:
-                json.dump(data, f, indent=2)
-            temp_file.replace(self._persistence_file)
+        Returns False if the write failed. Runs in a worker thread, so it leaves
+        the save state to the caller.
+        """
+        try:
+            # Ensure parent directory exists
+            self._persistence_file.parent.mkdir(parents=True, exist_ok=True)
 
-            logger.debug(
-                "Persisted %d session(s) to %s", len(sessions_data), self._persistence_file
-            )
+            if replace:
+                # Write atomically using a temp file, synced before the rename
+                target = self._persistence_file.with_suffix(".tmp")
+                flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            else:
+                target = self._persistence_file
+                flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+            fd = os.open(target, flags, 0o600)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if replace:
+                os.replace(target, self._persistence_file)
+
+            logger.debug("Persisted sessions to %s", self._persistence_file)
+            return True
         except Exception:
             logger.exception("Failed to persist sessions to %s", self._persistence_file)
+            return False
 
     async def handle_new_session(
         self, adapter: ServiceAdapter, request: BridgeSessionRequest
@@ -218,9 +402,11 @@ class SessionManager:
             service_metadata=request.service_metadata,
             github_repo=request.github_repo,
             github_installation_id=request.github_installation_id,
+            session_url=_build_session_url(acp_session_id),
         )
-        self._active_sessions[external_id] = active
-        self._save_sessions()  # Persist to disk
+        self._track(active)
+        self._dirty.add(external_id)
+        self._schedule_save()  # Persist to disk
 
         # Append git/PR instructions when working on a branch
         prompt = request.prompt
@@ -238,12 +424,12 @@ class SessionManager:
             )
 
         # Send the prompt and wait for completion
-        session_url = self._build_session_url(acp_session_id)
+        session_url = active.session_url
 
         try:
             stop_reason = await acp_session.prompt(prompt)
-            # Flush any remaining buffered updates
-            await router.flush()
+            # Flush any remaining buffered updates; later ones are dropped
+            await router.close()
 
             if stop_reason == "end_turn":
                 await adapter.send_completion(
@@ -261,10 +447,13 @@ class SessionManager:
                 )
         except Exception:
             logger.exception("Error during ACP prompt for %s", external_id)
+            # Deliver the text buffered before the failure ahead of the error
+            await router.close()
             await adapter.send_error(external_id, "Agent encountered an error during execution")
         finally:
             # Stop the subprocess but KEEP the ActiveSession record
             # This allows follow-ups to resume with the same acp_session_id
+            await router.close()
             await acp_session.stop()
             logger.info(
                 "Stopped ACP subprocess for %s (session record kept for resumption)", external_id
@@ -275,7 +464,7 @@ class SessionManager:
 
         Resumes the ACP session with full conversation history.
         """
-        active = self._active_sessions.get(external_session_id)
+        active = self._get_session(external_session_id)
         if active is None:
             logger.warning("No active session for follow-up: %s", external_session_id)
             return
@@ -349,11 +538,14 @@ class SessionManager:
         active.acp_session = acp_session
         active.update_router = router
 
-        session_url = self._build_session_url(active.acp_session_id)
+        if not active.session_url:
+            active.session_url = _build_session_url(active.acp_session_id)
+        session_url = active.session_url
+        self.touch(external_session_id)
 
         try:
             stop_reason = await acp_session.prompt(prompt)
-            await router.flush()
+            await router.close()
 
             if stop_reason == "end_turn":
                 await adapter.send_completion(
@@ -367,10 +559,12 @@ class SessionManager:
                 )
         except Exception:
             logger.exception("Error during follow-up prompt for %s", external_session_id)
+            await router.close()
             await adapter.send_error(
                 external_session_id, "Agent encountered an error during follow-up"
             )
         finally:
+            await router.close()
             await acp_session.stop()
 
     async def handle_cancel(self, external_session_id: str) -> None:
@@ -385,43 +579,32 @@ class SessionManager:
         """Restore persisted sessions for a given adapter.
 
         This is called when an adapter starts up after a container restart.
-        It recreates ActiveSession records from persisted metadata, allowing
-        follow-ups to resume with full conversation history.
+        It registers persisted metadata so follow-ups can resume with full
+        conversation history; the ActiveSession records themselves are built on
+        first use (see _get_session).
         """
         if not self._persisted_metadata:
             return
 
         restored_count = 0
         # Match adapter to sessions: exact match or legacy match (e.g. "slack" matches "slack:default")
-        adapter_service_type = adapter.service_name.split(":")[0]
-        for external_id, metadata in self._persisted_metadata.items():
+        adapter_service = adapter.service_name
+        adapter_service_type = adapter_service.split(":")[0]
+        adapter_agent = adapter_service.split(":")[-1]
+        for external_id, metadata in self._persisted_by_service_type.get(adapter_service_type, ()):
             session_service = metadata["service_name"]
-            if session_service == adapter.service_name or (
+            if session_service == adapter_service or (
                 session_service == adapter_service_type
-                and metadata.get("agent_name", "") in ("", adapter.service_name.split(":")[-1])
+                and metadata.get("agent_name", "") in ("", adapter_agent)
             ):
                 # Skip if already active (shouldn't happen, but be defensive)
-                if external_id in self._active_sessions:
+                if external_id in self._active_sessions or external_id in self._lazy_sessions:
                     continue
 
-                # Create a partial ActiveSession that can be resumed on follow-up
-                # Use the adapter's service_name so get_sessions_for_service() matches
-                self._active_sessions[external_id] = ActiveSession(
-                    external_session_id=metadata["external_session_id"],
-                    service_name=adapter.service_name,
-                    adapter=adapter,
-                    acp_session=None,  # Will be created on follow-up
-                    update_router=None,  # Will be created on follow-up
-                    acp_session_id=metadata["acp_session_id"],
-                    cwd=metadata["cwd"],
-                    branch_name=metadata.get("branch_name", ""),
-                    agent_name=metadata.get("agent_name", ""),
-                    service_metadata=metadata.get(
-                        "service_metadata"
-                    ),  # Restore adapter-specific state
-                    github_repo=metadata.get("github_repo", ""),
-                    github_installation_id=metadata.get("github_installation_id", 0),
-                )
+                # Defer building the ActiveSession until a follow-up (or the adapter)
+                # asks for it; persist it under the adapter's service_name either way
+                self._lazy_sessions[external_id] = (metadata, adapter)
+                self._snapshot[external_id] = {**metadata, "service_name": adapter_service}
                 restored_count += 1
 
         if restored_count > 0:
@@ -433,21 +616,41 @@ class SessionManager:
 
     def get_sessions_for_service(self, service_name: str) -> dict[str, ActiveSession]:
         """Get all active sessions for a given service name."""
-        return {
-            ext_id: session
-            for ext_id, session in self._active_sessions.items()
-            if session.service_name == service_name
-        }
+        lazy_ids = [
+            external_id
+            for external_id, (_, adapter) in self._lazy_sessions.items()
+            if adapter.service_name == service_name
+        ]
+        for external_id in lazy_ids:
+            self._get_session(external_id)
+        return dict(self._by_service.get(service_name, {}))
+
+    def get_service_metadata_for_service(self, service_name: str) -> dict[str, dict[str, Any]]:
+        """Get the service metadata of every session for a service, keyed by external ID.
+
+        Unlike get_sessions_for_service(), lazily restored sessions are read as-is
+        rather than materialized. The dicts are shared with the sessions, so adapters
+        may keep and mutate them (calling touch() afterwards).
+        """
+        service_metadata: dict[str, dict[str, Any]] = {}
+        for external_id, (metadata, adapter) in self._lazy_sessions.items():
+            if adapter.service_name == service_name and metadata.get("service_metadata"):
+                service_metadata[external_id] = metadata["service_metadata"]
+        for external_id, active in self._by_service.get(service_name, {}).items():
+            if active.service_metadata:
+                service_metadata[external_id] = active.service_metadata
+        return service_metadata
 
     async def remove_session(self, external_session_id: str) -> None:
         """Remove a session from tracking, clean up its worktree, and persist."""
-        active = self._active_sessions.get(external_session_id)
+        active = self._get_session(external_session_id)
         if active is not None:
             await self._repo_provider.cleanup_worktree(
                 active.cwd, branch_name=active.branch_name, github_repo=active.github_repo
             )
-            del self._active_sessions[external_session_id]
-            self._save_sessions()
+            self._untrack(external_session_id)
+            self._dirty.add(external_session_id)
+            self._schedule_save()
             logger.info("Removed session %s from tracking", external_session_id)
 
     async def shutdown(self) -> None:
@@ -458,5 +661,18 @@ class SessionManager:
                     await active.acp_session.stop()
             except Exception:
                 logger.exception("Error stopping session %s", active.external_session_id)
-        # Don't clear sessions or save empty state — keep persisted data for restart
+        # Flush any pending save, then keep persisted data for restart — don't
+        # clear sessions from disk or save empty state
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if self._save_task is not None:
+            await self._save_task
+        # Rewrite every live session in full, so metadata an adapter changed without
+        # calling touch() isn't lost
+        self._dirty.update(self._active_sessions)
+        self._compact_next = True
+        self._save_sessions()
         self._active_sessions.clear()
+        self._by_service.clear()
+        self._lazy_sessions.clear()
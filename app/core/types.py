@@ -6,7 +6,7 @@ from typing import Any, Literal, Protocol
 from fastapi import FastAPI
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BridgeSessionRequest:
     """A service-agnostic request to start or continue an agent session."""
 
@@ -21,7 +21,7 @@ class BridgeSessionRequest:
     github_installation_id: int = 0  # Override installation ID; falls back to default
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BridgeUpdate:
     """A service-agnostic update from the agent."""
 
@@ -57,6 +57,14 @@ class ServiceAdapter(Protocol):
         """
         ...
 
+    def restore_persisted_sessions(self) -> None:
+        """Rebuild adapter state from sessions restored by the session manager.
+
+        Optional: No-op for adapters that keep no per-session state.
+        Called during app startup before start().
+        """
+        ...
+
     async def on_session_created(self, event: Any) -> BridgeSessionRequest:
         """Parse an incoming event into a service-agnostic session request.
 
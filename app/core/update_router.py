@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from acp.schema import (
@@ -40,32 +41,42 @@ class UpdateRouter:
     def __init__(self, adapter: ServiceAdapter, external_session_id: str):
         self._adapter = adapter
         self._external_session_id = external_session_id
-        self._message_buffer = ""
-        self._thought_buffer = ""
+        # Text chunks are joined only at flush time
+        self._message_chunks: list[str] = []
+        self._thought_chunks: list[str] = []
+        # Pending debounce timer, and the flush task it last spawned (kept referenced)
+        self._flush_handle: asyncio.TimerHandle | None = None
         self._flush_task: asyncio.Task[None] | None = None
         self._lock = asyncio.Lock()
+        # Set once the session's turn is over; late updates are dropped
+        self._closed = False
+        # Update types this router forwards; anything else is ignored
+        self._handlers: dict[type, Callable[[Any], Awaitable[None]]] = {
+            AgentThoughtChunk: self._handle_thought,
+            AgentMessageChunk: self._handle_message,
+            ToolCallStart: self._handle_tool_call_start,
+            ToolCallProgress: self._handle_tool_call_progress,
+            AgentPlanUpdate: self._handle_plan,
+        }
 
     async def handle_update(self, session_id: str, update: SessionUpdate) -> None:
         """Process a single ACP session update."""
-        if isinstance(update, AgentThoughtChunk):
-            await self._handle_thought(update)
-        elif isinstance(update, AgentMessageChunk):
-            await self._handle_message(update)
-        elif isinstance(update, ToolCallStart):
-            await self._handle_tool_call_start(update)
-        elif isinstance(update, ToolCallProgress):
-            await self._handle_tool_call_progress(update)
-        elif isinstance(update, AgentPlanUpdate):
-            await self._handle_plan(update)
-
+        if self._closed:
+            return
+        handler = self._handlers.get(type(update))
+        if handler is not None:
+            await handler(update)
+
+    # Exact type checks below: these run per streamed token, and the schema's content
+    # blocks are never subclassed
     async def _handle_thought(self, update: AgentThoughtChunk) -> None:
-        if isinstance(update.content, TextContentBlock):
-            self._thought_buffer += update.content.text
+        if type(update.content) is TextContentBlock:
+            self._thought_chunks.append(update.content.text)
             self._ensure_flush_scheduled()
 
     async def _handle_message(self, update: AgentMessageChunk) -> None:
-        if isinstance(update.content, TextContentBlock):
-            self._message_buffer += update.content.text
+        if type(update.content) is TextContentBlock:
+            self._message_chunks.append(update.content.text)
             self._ensure_flush_scheduled()
 
     async def _handle_tool_call_start(self, update: ToolCallStart) -> None:
@@ -108,34 +119,59 @@ class UpdateRouter:
             BridgeUpdate(type="plan", content="Plan updated", metadata={"entries": entries}),
         )
 
-    def _ensure_flush_scheduled(self) -> None:
-        if self._flush_task is None or self._flush_task.done():
-            self._flush_task = asyncio.create_task(self._delayed_flush())
+    async def close(self) -> None:
+        """Flush any buffered text, then stop routing: later updates are dropped.
 
-    async def _delayed_flush(self) -> None:
-        await asyncio.sleep(DEBOUNCE_INTERVAL)
+        Call once the turn's prompt has returned or failed, before reporting the
+        outcome. Calling it again is a no-op.
+        """
         await self.flush()
+        self._closed = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    def _ensure_flush_scheduled(self) -> None:
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                DEBOUNCE_INTERVAL, self._on_flush_timer
+            )
+
+    def _on_flush_timer(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self.flush())
 
     async def flush(self) -> None:
-        """Flush any buffered text to the adapter."""
+        """Flush any buffered text to the adapter.
+
+        The lock keeps flushes in order: a caller that finds the buffers empty
+        while another flush is still sending must wait for it, or its own update
+        (e.g. a tool call) could overtake the text being sent.
+        """
+        if not self._thought_chunks and not self._message_chunks and not self._lock.locked():
+            return
+
         async with self._lock:
-            if self._thought_buffer:
-                text = self._thought_buffer
-                self._thought_buffer = ""
+            # Take both buffers before the first await; chunks arriving while
+            # sending belong to the next flush
+            thought = "".join(self._thought_chunks)
+            message = "".join(self._message_chunks)
+            self._thought_chunks.clear()
+            self._message_chunks.clear()
+
+            # Cancel pending flush if we just flushed manually
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+
+            if thought:
                 await self._adapter.send_update(
                     self._external_session_id,
-                    BridgeUpdate(type="thought", content=text),
+                    BridgeUpdate(type="thought", content=thought),
                 )
 
-            if self._message_buffer:
-                text = self._message_buffer
-                self._message_buffer = ""
+            if message:
                 await self._adapter.send_update(
                     self._external_session_id,
-                    BridgeUpdate(type="message_chunk", content=text),
+                    BridgeUpdate(type="message_chunk", content=message),
                 )
-
-            # Cancel pending flush if we just flushed manually
-            if self._flush_task is not None and not self._flush_task.done():
-                self._flush_task.cancel()
-                self._flush_task = None
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 from app.config import settings
 from app.core.repo_provider import RepoProvider
@@ -15,16 +19,116 @@ from app.core.types import ServiceAdapter
 from app.services.github.auth import GitHubAuth
 from app.session_viewer.router import router as session_viewer_router
 
+# Configure logging at import so messages emitted during startup share the format.
+# No-op if the host (e.g. uvicorn --log-config, tests) already installed handlers.
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+
 logger = logging.getLogger(__name__)
 
-# Module-level references for access during requests
-_session_manager: SessionManager | None = None
-_adapters: list[ServiceAdapter] = []
+Lifespan = Callable[[FastAPI], AbstractAsyncContextManager[None]]
+
+
+@dataclass(slots=True, frozen=True)
+class AgentContext:
+    """Per-agent inputs shared by every adapter factory."""
+
+    name: str
+    is_default: bool
+    credentials: dict[str, Any] = field(repr=False)
+    github_auth: GitHubAuth | None = field(default=None, repr=False)
+    github_route: str = "/webhooks/github"
+    linear_route: str = "/webhooks/linear"
+
+
+def _build_agent_contexts() -> list[AgentContext]:
+    """Resolve credentials and GitHub auth for every agent in a single pass."""
+    contexts: list[AgentContext] = []
+    for agent_name, agent_config in settings.agents.items():
+        creds = settings.get_agent_credentials(agent_name)
+        github_auth: GitHubAuth | None = None
+        if settings.github_repo:
+            app_id = creds.get("GITHUB_APP_ID")
+            private_key = creds.get("GITHUB_PRIVATE_KEY")
+            if app_id and private_key:
+                github_auth = GitHubAuth(app_id=app_id, private_key=private_key)
+        # The default agent owns the bare webhook paths; others get a per-agent suffix
+        suffix = "" if agent_config.default else f"/{agent_name}"
+        contexts.append(
+            AgentContext(
+                agent_name,
+                agent_config.default,
+                creds,
+                github_auth,
+                github_route=f"/webhooks/github{suffix}",
+                linear_route=f"/webhooks/linear{suffix}",
+            )
+        )
+    return contexts
+
+
+def _build_slack_adapter(session_manager: SessionManager, agent: AgentContext) -> ServiceAdapter:
+    from app.services.slack.adapter import SlackAdapter
+
+    return SlackAdapter(
+        session_manager,
+        agent_name=agent.name,
+        bot_token=agent.credentials["SLACK_BOT_TOKEN"],
+        app_token=agent.credentials["SLACK_APP_TOKEN"],
+    )
+
+
+def _build_github_adapter(session_manager: SessionManager, agent: AgentContext) -> ServiceAdapter:
+    from app.services.github.adapter import GitHubAdapter
+
+    return GitHubAdapter(
+        session_manager,
+        agent_name=agent.name,
+        webhook_secret=agent.credentials.get("GITHUB_WEBHOOK_SECRET", ""),
+        route_path=agent.github_route,
+        auth=agent.github_auth,
+        bot_login=agent.credentials.get("GITHUB_BOT_LOGIN", ""),
+    )
+
+
+def _build_linear_adapter(session_manager: SessionManager, agent: AgentContext) -> ServiceAdapter:
+    from app.services.linear.adapter import LinearAdapter
+
+    return LinearAdapter(
+        session_manager,
+        agent_name=agent.name,
+        access_token=agent.credentials["LINEAR_ACCESS_TOKEN"],
+        webhook_secret=agent.credentials.get("LINEAR_WEBHOOK_SECRET", ""),
+        route_path=agent.linear_route,
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class AdapterSpec:
+    """How to build one service's adapter for an agent."""
+
+    service: str
+    factory: Callable[[SessionManager, AgentContext], ServiceAdapter]
+    required: tuple[str, ...] = ()  # Credentials that must be set, else the adapter is skipped
+
+
+# Adapter specs keyed by service name. Each factory imports its adapter
+# lazily so disabled services never load their SDK dependencies.
+ADAPTER_SPECS: dict[str, AdapterSpec] = {
+    spec.service: spec
+    for spec in (
+        AdapterSpec("slack", _build_slack_adapter, ("SLACK_BOT_TOKEN", "SLACK_APP_TOKEN")),
+        AdapterSpec("github", _build_github_adapter),
+        AdapterSpec("linear", _build_linear_adapter, ("LINEAR_ACCESS_TOKEN",)),
+    )
+}
 
 
 def _create_adapters(
     session_manager: SessionManager,
-    github_auth_map: dict[str, GitHubAuth] | None = None,
+    agents: list[AgentContext],
 ) -> list[ServiceAdapter]:
     """Instantiate adapters for all enabled services, one per agent.
 
@@ -32,104 +136,37 @@ def _create_adapters(
     enabled service with agent-specific credentials.
     """
     adapters: list[ServiceAdapter] = []
-    github_auth_map = github_auth_map or {}
-
-    for agent_name, agent_config in settings.agents.items():
-        is_default = agent_config.default
-
-        for service in settings.enabled_services_list:
-            if service == "slack":
-                from app.services.slack.adapter import SlackAdapter
-
-                bot_token = settings.get_service_credential("SLACK_BOT_TOKEN", agent_name)
-                app_token = settings.get_service_credential("SLACK_APP_TOKEN", agent_name)
-                if bot_token and app_token:
-                    adapters.append(
-                        SlackAdapter(
-                            session_manager,
-                            agent_name=agent_name,
-                            bot_token=bot_token,
-                            app_token=app_token,
-                        )
-                    )
-                else:
-                    logger.warning(
-                        "Slack tokens missing for agent %s — skipping Slack adapter",
-                        agent_name,
-                    )
-
-            elif service == "github":
-                from app.services.github.adapter import GitHubAdapter
-
-                webhook_secret = settings.get_service_credential(
-                    "GITHUB_WEBHOOK_SECRET", agent_name
-                )
-                bot_login = settings.get_service_credential("GITHUB_BOT_LOGIN", agent_name)
-                route_path = "/webhooks/github" if is_default else f"/webhooks/github/{agent_name}"
-                github_auth = github_auth_map.get(agent_name)
-                adapters.append(
-                    GitHubAdapter(
-                        session_manager,
-                        agent_name=agent_name,
-                        webhook_secret=webhook_secret,
-                        route_path=route_path,
-                        auth=github_auth,
-                        bot_login=bot_login,
-                    )
-                )
-
-            elif service == "linear":
-                from app.services.linear.adapter import LinearAdapter
 
-                access_token = settings.get_service_credential("LINEAR_ACCESS_TOKEN", agent_name)
-                webhook_secret = settings.get_service_credential(
-                    "LINEAR_WEBHOOK_SECRET", agent_name
+    specs: list[AdapterSpec] = []
+    for service in settings.enabled_services_list:
+        spec = ADAPTER_SPECS.get(service)
+        if spec is None:
+            logger.warning("Unknown service: %s (skipping)", service)
+        else:
+            specs.append(spec)
+
+    for agent in agents:
+        for spec in specs:
+            missing = [name for name in spec.required if not agent.credentials.get(name)]
+            if missing:
+                logger.warning(
+                    "%s missing for agent %s — skipping %s adapter",
+                    ", ".join(missing),
+                    agent.name,
+                    spec.service,
                 )
-                route_path = "/webhooks/linear" if is_default else f"/webhooks/linear/{agent_name}"
-                if access_token:
-                    adapters.append(
-                        LinearAdapter(
-                            session_manager,
-                            agent_name=agent_name,
-                            access_token=access_token,
-                            webhook_secret=webhook_secret,
-                            route_path=route_path,
-                        )
-                    )
-                else:
-                    logger.warning(
-                        "Linear access token missing for agent %s — skipping",
-                        agent_name,
-                    )
-
-            else:
-                logger.warning("Unknown service: %s (skipping)", service)
+                continue
+            adapters.append(spec.factory(session_manager, agent))
 
     return adapters
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+async def bridge_lifespan(app: FastAPI) -> AsyncIterator[None]:
     """App lifespan: initialize session manager and adapters, clean up on shutdown."""
-    global _session_manager, _adapters
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-    )
-
-    # Build per-agent GitHub auth instances
-    github_auth_map: dict[str, GitHubAuth] = {}
-    default_github_auth: GitHubAuth | None = None
-    if settings.github_repo:
-        for agent_name, _agent_cfg in settings.agents.items():
-            app_id = settings.get_service_credential("GITHUB_APP_ID", agent_name)
-            private_key = settings.get_service_credential("GITHUB_PRIVATE_KEY", agent_name)
-            if app_id and private_key:
-                auth = GitHubAuth(app_id=app_id, private_key=private_key)
-                github_auth_map[agent_name] = auth
-                if default_github_auth is None:
-                    default_github_auth = auth
+    agents = _build_agent_contexts()
+    github_auth_map = {a.name: a.github_auth for a in agents if a.github_auth is not None}
+    default_github_auth = next(iter(github_auth_map.values()), None)
 
     # Create shared RepoProvider (default auth for clone/fetch, auth_map for per-agent GH_TOKEN)
     repo_provider = RepoProvider(
@@ -138,20 +175,33 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         enabled_services=settings.enabled_services_list,
     )
 
-    _session_manager = SessionManager(repo_provider=repo_provider)
-    _adapters = _create_adapters(_session_manager, github_auth_map=github_auth_map)
+    session_manager = SessionManager(repo_provider=repo_provider)
+    await session_manager.initialize()
+    adapters = _create_adapters(session_manager, agents)
 
-    # Register routes and start each adapter
-    for adapter in _adapters:
+    # Exposed to request handlers via request.app.state
+    app.state.session_manager = session_manager
+    app.state.adapters = adapters
+
+    # Register routes and restore persisted sessions BEFORE starting any adapter
+    # (to avoid race condition with incoming events)
+    for adapter in adapters:
         adapter.register_routes(app)
-        # Restore any persisted sessions BEFORE starting (to avoid race condition)
-        _session_manager.restore_sessions_for_adapter(adapter)
-        restore_fn = getattr(adapter, "restore_persisted_sessions", None)
-        if restore_fn is not None:
-            restore_fn()
-        # Now start the adapter (begins receiving events)
-        await adapter.start()
-        logger.info("Started adapter: %s", adapter.service_name)
+        session_manager.restore_sessions_for_adapter(adapter)
+        adapter.restore_persisted_sessions()
+
+    # Start adapters concurrently so their connection handshakes overlap
+    results = await asyncio.gather(*(a.start() for a in adapters), return_exceptions=True)
+    for adapter, result in zip(adapters, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(
+                "Failed to start adapter %s: %s",
+                adapter.service_name,
+                result,
+                exc_info=result,
+            )
+        else:
+            logger.info("Started adapter: %s", adapter.service_name)
 
     logger.info("ACP Bridge started (services: %s)", settings.enabled_services)
 
@@ -159,32 +209,56 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Shutdown
     logger.info("Shutting down ACP Bridge...")
-    await _session_manager.shutdown()
+    await session_manager.shutdown()
 
-    for adapter in _adapters:
-        await adapter.close()
+    results = await asyncio.gather(
+        *(adapter.close() for adapter in adapters),
+        *(auth.close() for auth in github_auth_map.values()),
+        repo_provider.close(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error("Error during shutdown: %s", result, exc_info=result)
 
-    for auth in github_auth_map.values():
-        await auth.close()
+    del app.state.session_manager
+    del app.state.adapters
 
-    _session_manager = None
-    _adapters = []
 
+# Settings don't change after startup, so the health body is serialized once
+_HEALTH_BODY = json.dumps({"status": "ok", "services": settings.enabled_services}).encode()
 
-app = FastAPI(
-    title="ACP Bridge",
-    description="Service-agnostic bridge connecting external services to ACP agents",
-    version="0.1.0",
-    lifespan=lifespan,
-)
 
-# Session viewer web UI
-app.include_router(session_viewer_router)
+async def health() -> Response:
+    return Response(_HEALTH_BODY, media_type="application/json")
+
+
+def make_app(extra_lifespan: Lifespan | None = None) -> FastAPI:
+    """Build the bridge app, optionally nesting an extra lifespan inside the bridge's.
+
+    The extra lifespan starts after the bridge is up and shuts down before it.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        async with bridge_lifespan(app):
+            if extra_lifespan is None:
+                yield
+            else:
+                async with extra_lifespan(app):
+                    yield
+
+    app = FastAPI(
+        title="ACP Bridge",
+        description="Service-agnostic bridge connecting external services to ACP agents",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
+
+    # Session viewer web UI
+    app.include_router(session_viewer_router)
+    app.get("/health")(health)
+    return app
 
 
-@app.get("/health")
-async def health() -> dict[str, str]:
-    return {
-        "status": "ok",
-        "services": settings.enabled_services,
-    }
+app = make_app()
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import re
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from fastapi import FastAPI, Request, Response
@@ -23,6 +28,75 @@ from app.services.github.webhooks import verify_signature
 
 logger = logging.getLogger(__name__)
 
+GitHubEventPayload = IssuesPayload | IssueCommentPayload | PullRequestReviewCommentPayload
+
+# Minimum delay between progress comment edits; updates in between are coalesced
+PROGRESS_EDIT_INTERVAL = 0.5  # seconds
+
+# Upper bound on issues/PRs remembered for follow-ups; oldest-used are dropped first
+MAX_TRACKED_SESSIONS = 10_000
+
+# Webhook intake: deliveries wait in a bounded queue drained by a fixed pool of
+# workers; when the queue is full the route answers 503 instead of piling up tasks
+WEBHOOK_QUEUE_SIZE = 1000
+WEBHOOK_WORKERS = 16
+
+# How long close() lets in-flight agent turns post their outcome before cancelling them
+TURN_SHUTDOWN_TIMEOUT = 10.0  # seconds
+
+
+@lru_cache
+def _compile_mention_pattern(bot_login: str) -> re.Pattern[str]:
+    """Pattern matching an @mention of the bot.
+
+    The bot login is "slug[bot]" — users @mention as @slug or @slug[bot]. The
+    mention must start the text or follow whitespace and must not run into a
+    longer login, so "foo@slug" and "@slug-other" don't match.
+    """
+    slug = bot_login.removesuffix("[bot]")
+    return re.compile(
+        rf"(?:^|(?<=\s))@{re.escape(slug)}(?:\[bot\])?(?![\w-])\s*",
+        re.IGNORECASE,
+    )
+
+
+# SessionState fields persisted as the session's service_metadata
+_METADATA_FIELDS = (
+    "owner",
+    "repo",
+    "issue_number",
+    "installation_id",
+    "progress_comment_id",
+    "trigger_comment_id",
+    "trigger_issue_number",
+    "current_text",
+    "is_review_comment",
+)
+
+
+@dataclass(slots=True)
+class SessionState:
+    """Per-session GitHub state: where to post progress and the buffered reply."""
+
+    owner: str
+    repo: str
+    issue_number: int
+    installation_id: int
+    progress_comment_id: int
+    trigger_comment_id: int | None = None
+    trigger_issue_number: int | None = None
+    current_text: str = "_Thinking..._"
+    is_review_comment: bool = False
+    # Accumulated message chunks for the final response (not persisted)
+    message_buffer: str = ""
+
+    def to_metadata(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in _METADATA_FIELDS}
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, Any]) -> SessionState:
+        return cls(**{name: metadata[name] for name in _METADATA_FIELDS if name in metadata})
+
 
 class GitHubAdapter:
     """Service adapter for GitHub App webhooks.
@@ -49,25 +123,52 @@ class GitHubAdapter:
         self.service_name: str = f"github:{agent_name}" if agent_name else "github"
         self._auth = auth or GitHubAuth()
         self._api = GitHubApiClient(self._auth)
-        self._webhook_secret = webhook_secret or settings.github_webhook_secret
+        # Encoded once; the HMAC runs on every webhook delivery
+        self._webhook_secret = (webhook_secret or settings.github_webhook_secret).encode("utf-8")
         self._route_path = route_path
         self._bot_login: str | None = bot_login or settings.github_bot_login or None
-        # Track session data: {session_id: {owner, repo, issue_number, ...}}
-        self._sessions: dict[str, dict[str, Any]] = {}
-        # Accumulate message chunks for final response
-        self._message_buffers: dict[str, str] = {}
-        # Track issues/PRs where bot has been mentioned (persists after session completion)
-        # Format: {session_id} — e.g. "github:owner/repo:42:agent_name"
-        self._active_issues: set[str] = set()
+        self._mention_pattern: re.Pattern[str] | None = (
+            _compile_mention_pattern(self._bot_login) if self._bot_login else None
+        )
+        # Issues/PRs where the bot has been mentioned (kept after session completion),
+        # least recently used first and capped at MAX_TRACKED_SESSIONS
+        # Keyed by session_id — e.g. "github:owner/repo:42:agent_name"
+        self._sessions: OrderedDict[str, SessionState] = OrderedDict()
+        # Coalesced progress edits: armed timers and in-flight PATCHes per session
+        self._pending_edits: dict[str, asyncio.TimerHandle] = {}
+        self._edit_tasks: dict[str, asyncio.Task[None]] = {}
+        # Handled webhook events: event type -> (payload model, action, handler)
+        self._event_handlers: dict[
+            str, tuple[type[GitHubEventPayload], str, Callable[[Any], Awaitable[None]]]
+        ] = {
+            "issues": (IssuesPayload, "opened", self._handle_issue_opened),
+            "issue_comment": (IssueCommentPayload, "created", self._handle_issue_comment),
+            "pull_request_review_comment": (
+                PullRequestReviewCommentPayload,
+                "created",
+                self._handle_review_comment,
+            ),
+        }
+        # Verified webhook deliveries awaiting dispatch: (event_type, raw_body)
+        self._webhook_queue: asyncio.Queue[tuple[str, bytes]] = asyncio.Queue(
+            maxsize=WEBHOOK_QUEUE_SIZE
+        )
+        self._workers: list[asyncio.Task[None]] = []
         # Keep references to background tasks so they aren't garbage collected
         self._background_tasks: set[asyncio.Task[None]] = set()
+        # Agent turns (new sessions and follow-ups), which close() waits on
+        self._turn_tasks: set[asyncio.Task[None]] = set()
 
     async def start(self) -> None:
-        """Auto-detect the bot login from the GitHub App at startup."""
+        """Start the webhook workers and auto-detect the bot login from the GitHub App."""
+        self._workers = [
+            asyncio.create_task(self._webhook_worker()) for _ in range(WEBHOOK_WORKERS)
+        ]
         if not self._bot_login:
             try:
                 slug = await self._auth.get_app_slug()
                 self._bot_login = f"{slug}[bot]"
+                self._mention_pattern = _compile_mention_pattern(self._bot_login)
                 logger.info("Auto-detected GitHub bot login: %s", self._bot_login)
             except Exception:
                 logger.exception(
@@ -76,11 +177,12 @@ class GitHubAdapter:
 
     def restore_persisted_sessions(self) -> None:
         """Rebuild adapter state from sessions restored by the session manager."""
-        restored = self._session_manager.get_sessions_for_service(self.service_name)
-        for session_id, active in restored.items():
-            if active.service_metadata:
-                self._sessions[session_id] = active.service_metadata
-                self._active_issues.add(session_id)
+        restored = self._session_manager.get_service_metadata_for_service(self.service_name)
+        for session_id, metadata in restored.items():
+            try:
+                self._track_session(session_id, SessionState.from_metadata(metadata))
+            except TypeError:
+                logger.warning("Skipping session %s with incomplete metadata", session_id)
         if restored:
             logger.info("Restored %d GitHub session(s) from persistence", len(restored))
 
@@ -108,32 +210,74 @@ class GitHubAdapter:
                 logger.info("GitHub webhook ping received")
                 return Response(status_code=200)
 
-            if event_type == "issues":
-                issues_payload = IssuesPayload.model_validate_json(raw_body)
-                if issues_payload.action == "opened":
-                    task = asyncio.create_task(self._handle_issue_opened(issues_payload))
-                    self._background_tasks.add(task)
-                    task.add_done_callback(self._background_tasks.discard)
-
-            elif event_type == "issue_comment":
-                payload = IssueCommentPayload.model_validate_json(raw_body)
-                if payload.action == "created":
-                    task = asyncio.create_task(self._handle_issue_comment(payload))
-                    self._background_tasks.add(task)
-                    task.add_done_callback(self._background_tasks.discard)
-
-            elif event_type == "pull_request_review_comment":
-                payload = PullRequestReviewCommentPayload.model_validate_json(raw_body)
-                if payload.action == "created":
-                    task = asyncio.create_task(self._handle_review_comment(payload))
-                    self._background_tasks.add(task)
-                    task.add_done_callback(self._background_tasks.discard)
-
-            else:
+            if event_type not in adapter._event_handlers:
                 logger.debug("Ignoring GitHub event: %s", event_type)
+                return Response(status_code=200)
+
+            # Validate and handle after acknowledging, so GitHub gets its 200 right
+            # away and large payloads don't hold up the request handler
+            try:
+                adapter._webhook_queue.put_nowait((event_type, raw_body))
+            except asyncio.QueueFull:
+                logger.warning("GitHub webhook queue full, rejecting %s event", event_type)
+                return Response(status_code=503)
 
             return Response(status_code=200)
 
+    async def _webhook_worker(self) -> None:
+        """Dispatch queued webhook deliveries one at a time."""
+        while True:
+            event_type, raw_body = await self._webhook_queue.get()
+            try:
+                await self._dispatch_event(event_type, raw_body)
+            finally:
+                self._webhook_queue.task_done()
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Run a coroutine as a tracked background task."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _spawn_turn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run an agent turn as a tracked task that close() gives time to finish."""
+        task = asyncio.create_task(coro)
+        self._turn_tasks.add(task)
+        task.add_done_callback(self._turn_tasks.discard)
+
+    async def _dispatch_event(self, event_type: str, raw_body: bytes) -> None:
+        """Parse a verified webhook body and run the handler for its event type."""
+        model, wanted_action, handler = self._event_handlers[event_type]
+        try:
+            # Parse once; the event model validates from the decoded dict
+            data = json.loads(raw_body)
+            if not self._is_actionable(data, wanted_action):
+                return
+            payload = model.model_validate(data)
+            await handler(payload)
+        except Exception:
+            logger.exception("Error handling GitHub %s event", event_type)
+
+    def _is_actionable(self, data: Any, wanted_action: str) -> bool:
+        """Cheap checks on the decoded payload before validating the full model.
+
+        Mirrors the handlers' early returns (other actions, our own bot's posts,
+        text without an @mention) so most deliveries never build a model.
+        """
+        if not isinstance(data, dict) or data.get("action") != wanted_action:
+            return False
+        # Comment events carry the text on the comment; issues events on the issue
+        comment = data.get("comment")
+        if isinstance(comment, dict):
+            body, author = comment.get("body"), comment.get("user")
+        else:
+            body, author = (data.get("issue") or {}).get("body"), data.get("sender")
+        if not body or "@" not in body:
+            return False
+        author = author or {}
+        return not self._is_bot_comment(author.get("type", ""), author.get("login", ""))
+
     async def on_session_created(self, event: Any) -> BridgeSessionRequest:
         """Not used — webhooks handle this via background tasks."""
         raise NotImplementedError
@@ -154,24 +298,37 @@ class GitHubAdapter:
 
         Returns the comment body with the @mention stripped, or None if not mentioned.
         """
-        if not self._bot_login:
+        # Most comments mention nobody; skip the regex scan for them
+        if self._mention_pattern is None or "@" not in body:
             return None
 
-        # The bot login is "slug[bot]" — users @mention as @slug or @slug[bot]
-        # Extract the slug part (before [bot])
-        slug = self._bot_login.removesuffix("[bot]")
-
-        # Match @slug or @slug[bot] (case-insensitive)
-        pattern = re.compile(
-            rf"@{re.escape(slug)}(?:\[bot\])?\s*",
-            re.IGNORECASE,
-        )
-
-        if not pattern.search(body):
+        # Strip every mention in one pass; no substitutions means no mention
+        prompt, count = self._mention_pattern.subn("", body)
+        if not count:
             return None
+        return prompt.strip()
 
-        prompt = pattern.sub("", body).strip()
-        return prompt
+    def _check_acknowledgement(
+        self,
+        session_id: str,
+        reaction: BaseException | None,
+        progress: BaseException | dict[str, Any],
+    ) -> int | None:
+        """Log failures from the concurrent ack calls; return the progress comment ID.
+
+        A failed reaction is only logged. Without a progress comment there is
+        nothing to edit, so None tells the caller to abandon the event.
+        """
+        if isinstance(reaction, BaseException):
+            logger.warning("Failed to add eyes reaction for %s", session_id, exc_info=reaction)
+        if isinstance(progress, BaseException):
+            logger.error(
+                "Failed to post initial progress comment for %s",
+                session_id,
+                exc_info=progress,
+            )
+            return None
+        return progress["id"]
 
     async def _fetch_issue_thread_context(
         self,
@@ -272,19 +429,18 @@ class GitHubAdapter:
             payload.sender.login,
         )
 
-        try:
-            # Acknowledge with eyes reaction on the issue
-            await self._api.create_issue_reaction(
+        # Acknowledge with eyes reaction on the issue and post progress comment
+        reaction, progress = await asyncio.gather(
+            self._api.create_issue_reaction(
                 owner, repo_name, issue_number, "eyes", installation_id
-            )
-
-            # Post progress comment
-            progress = await self._api.create_comment(
+            ),
+            self._api.create_comment(
                 owner, repo_name, issue_number, "_Thinking..._", installation_id
-            )
-            progress_comment_id = progress["id"]
-        except Exception:
-            logger.exception("Failed to post initial progress comment for %s", session_id)
+            ),
+            return_exceptions=True,
+        )
+        progress_comment_id = self._check_acknowledgement(session_id, reaction, progress)
+        if progress_comment_id is None:
             return
 
         # Build prompt with issue context
@@ -294,22 +450,16 @@ class GitHubAdapter:
         ]
         full_prompt = "\n\n".join(context_parts)
 
-        # Track session
-        session_data = {
-            "owner": owner,
-            "repo": repo_name,
-            "issue_number": issue_number,
-            "installation_id": installation_id,
-            "trigger_comment_id": None,
-            "trigger_issue_number": issue_number,
-            "progress_comment_id": progress_comment_id,
-            "current_text": "_Thinking..._",
-            "is_review_comment": False,
-        }
-        self._sessions[session_id] = session_data
-
-        # Mark this issue as active (persists after session ends)
-        self._active_issues.add(session_id)
+        # Track session (kept after the session ends so follow-ups find it)
+        state = SessionState(
+            owner=owner,
+            repo=repo_name,
+            issue_number=issue_number,
+            installation_id=installation_id,
+            progress_comment_id=progress_comment_id,
+            trigger_issue_number=issue_number,
+        )
+        self._track_session(session_id, state)
 
         request = BridgeSessionRequest(
             external_session_id=session_id,
@@ -317,12 +467,13 @@ class GitHubAdapter:
             prompt=full_prompt,
             agent_name=self._agent_name,
             descriptive_name=slugify(issue.title),
-            service_metadata=session_data,
+            service_metadata=state.to_metadata(),
             github_repo=repo.full_name,
             github_installation_id=installation_id,
         )
 
-        await self._session_manager.handle_new_session(self, request)
+        # The agent turn runs for minutes; don't hold a webhook worker for it
+        self._spawn_turn(self._session_manager.handle_new_session(self, request))
 
     async def _handle_issue_comment(self, payload: IssueCommentPayload) -> None:
         """Handle an issue_comment event."""
@@ -360,17 +511,16 @@ class GitHubAdapter:
             comment.user.login,
         )
 
-        try:
-            # Acknowledge with eyes reaction
-            await self._api.create_reaction(owner, repo_name, comment.id, "eyes", installation_id)
-
-            # Post progress comment
-            progress = await self._api.create_comment(
+        # Acknowledge with eyes reaction and post progress comment
+        reaction, progress = await asyncio.gather(
+            self._api.create_reaction(owner, repo_name, comment.id, "eyes", installation_id),
+            self._api.create_comment(
                 owner, repo_name, issue_number, "_Thinking..._", installation_id
-            )
-            progress_comment_id = progress["id"]
-        except Exception:
-            logger.exception("Failed to post initial progress comment for %s", session_id)
+            ),
+            return_exceptions=True,
+        )
+        progress_comment_id = self._check_acknowledgement(session_id, reaction, progress)
+        if progress_comment_id is None:
             return
 
         # Fetch comment history for thread context
@@ -383,19 +533,18 @@ class GitHubAdapter:
         )
 
         # Check if this is a follow-up on an active issue
-        if session_id in self._active_issues:
-            if session_id in self._sessions:
-                # Active session — send follow-up
-                logger.info("Sending follow-up to existing session %s", session_id)
-                # Update session tracking with new progress comment
-                self._sessions[session_id]["trigger_comment_id"] = comment.id
-                self._sessions[session_id]["progress_comment_id"] = progress_comment_id
-                self._sessions[session_id]["current_text"] = "_Thinking..._"
-                await self._session_manager.handle_followup(session_id, thread_context + prompt)
-                return
-            else:
-                # Session completed but issue still active — start new session
-                logger.info("Creating new session for continued issue conversation %s", session_id)
+        state = self._get_session(session_id)
+        if state is not None:
+            logger.info("Sending follow-up to existing session %s", session_id)
+            # Update session tracking with new progress comment
+            state.trigger_comment_id = comment.id
+            state.progress_comment_id = progress_comment_id
+            state.current_text = "_Thinking..._"
+            self._session_manager.touch(session_id, state.to_metadata())
+            self._spawn_turn(
+                self._session_manager.handle_followup(session_id, thread_context + prompt)
+            )
+            return
 
         # Build prompt with issue context
         issue = payload.issue
@@ -408,21 +557,16 @@ class GitHubAdapter:
         context_parts.append(f"User @{comment.user.login} commented:\n{prompt}")
         full_prompt = "\n\n".join(context_parts)
 
-        # Track session
-        session_data = {
-            "owner": owner,
-            "repo": repo_name,
-            "issue_number": issue_number,
-            "installation_id": installation_id,
-            "trigger_comment_id": comment.id,
-            "progress_comment_id": progress_comment_id,
-            "current_text": "_Thinking..._",
-            "is_review_comment": False,
-        }
-        self._sessions[session_id] = session_data
-
-        # Mark this issue as active (persists after session ends)
-        self._active_issues.add(session_id)
+        # Track session (kept after the session ends so follow-ups find it)
+        state = SessionState(
+            owner=owner,
+            repo=repo_name,
+            issue_number=issue_number,
+            installation_id=installation_id,
+            progress_comment_id=progress_comment_id,
+            trigger_comment_id=comment.id,
+        )
+        self._track_session(session_id, state)
 
         request = BridgeSessionRequest(
             external_session_id=session_id,
@@ -430,12 +574,13 @@ class GitHubAdapter:
             prompt=full_prompt,
             agent_name=self._agent_name,
             descriptive_name=slugify(issue.title),
-            service_metadata=session_data,
+            service_metadata=state.to_metadata(),
             github_repo=repo.full_name,
             github_installation_id=installation_id,
         )
 
-        await self._session_manager.handle_new_session(self, request)
+        # The agent turn runs for minutes; don't hold a webhook worker for it
+        self._spawn_turn(self._session_manager.handle_new_session(self, request))
 
     async def _handle_review_comment(self, payload: PullRequestReviewCommentPayload) -> None:
         """Handle a pull_request_review_comment event."""
@@ -473,24 +618,23 @@ class GitHubAdapter:
             comment.user.login,
         )
 
-        try:
-            # Acknowledge with eyes reaction
-            await self._api.create_reaction(
+        # Acknowledge with eyes reaction and reply in the review comment thread
+        reaction, progress = await asyncio.gather(
+            self._api.create_reaction(
                 owner,
                 repo_name,
                 comment.id,
                 "eyes",
                 installation_id,
                 is_review_comment=True,
-            )
-
-            # Reply in the review comment thread
-            progress = await self._api.create_review_comment_reply(
+            ),
+            self._api.create_review_comment_reply(
                 owner, repo_name, pr_number, comment.id, "_Thinking..._", installation_id
-            )
-            progress_comment_id = progress["id"]
-        except Exception:
-            logger.exception("Failed to post initial review comment reply for %s", session_id)
+            ),
+            return_exceptions=True,
+        )
+        progress_comment_id = self._check_acknowledgement(session_id, reaction, progress)
+        if progress_comment_id is None:
             return
 
         # Fetch issue-level comment history for thread context
@@ -502,51 +646,48 @@ class GitHubAdapter:
         )
 
         # Check if this is a follow-up on an active PR
-        if session_id in self._active_issues:
-            if session_id in self._sessions:
-                # Active session — send follow-up
-                logger.info("Sending follow-up to existing session %s", session_id)
-                self._sessions[session_id]["trigger_comment_id"] = comment.id
-                self._sessions[session_id]["progress_comment_id"] = progress_comment_id
-                self._sessions[session_id]["current_text"] = "_Thinking..._"
-                self._sessions[session_id]["is_review_comment"] = True
-                await self._session_manager.handle_followup(session_id, thread_context + prompt)
-                return
-            else:
-                logger.info("Creating new session for continued PR conversation %s", session_id)
+        state = self._get_session(session_id)
+        if state is not None:
+            logger.info("Sending follow-up to existing session %s", session_id)
+            state.trigger_comment_id = comment.id
+            state.progress_comment_id = progress_comment_id
+            state.current_text = "_Thinking..._"
+            state.is_review_comment = True
+            self._session_manager.touch(session_id, state.to_metadata())
+            self._spawn_turn(
+                self._session_manager.handle_followup(session_id, thread_context + prompt)
+            )
+            return
 
-        # Build prompt with PR + diff context
+        # Build prompt with PR + diff context. Fragments are joined once, so large
+        # PR bodies and diff hunks are copied only into the final prompt.
         pr = payload.pull_request
-        context_parts = []
+        parts: list[str] = []
         if thread_context:
-            context_parts.append(thread_context)
-        context_parts.append(f"Pull request: {pr.title} (#{pr.number})")
+            parts += (thread_context, "\n\n")
+        parts += ("Pull request: ", pr.title, f" (#{pr.number})")
         if pr.body:
-            context_parts.append(f"PR description:\n{pr.body}")
+            parts += ("\n\nPR description:\n", pr.body)
         if comment.path:
-            context_parts.append(f"File: {comment.path}")
+            parts += ("\n\nFile: ", comment.path)
         if comment.diff_hunk:
-            context_parts.append(f"Diff context:\n```\n{comment.diff_hunk}\n```")
+            parts += ("\n\nDiff context:\n```\n", comment.diff_hunk, "\n```")
         if comment.line:
-            context_parts.append(f"Line: {comment.line}")
-        context_parts.append(f"User @{comment.user.login} commented:\n{prompt}")
-        full_prompt = "\n\n".join(context_parts)
-
-        # Track session
-        session_data = {
-            "owner": owner,
-            "repo": repo_name,
-            "issue_number": pr_number,
-            "installation_id": installation_id,
-            "trigger_comment_id": comment.id,
-            "progress_comment_id": progress_comment_id,
-            "current_text": "_Thinking..._",
-            "is_review_comment": True,
-        }
-        self._sessions[session_id] = session_data
-
-        # Mark this PR as active (persists after session ends)
-        self._active_issues.add(session_id)
+            parts.append(f"\n\nLine: {comment.line}")
+        parts += (f"\n\nUser @{comment.user.login} commented:\n", prompt)
+        full_prompt = "".join(parts)
+
+        # Track session (kept after the session ends so follow-ups find it)
+        state = SessionState(
+            owner=owner,
+            repo=repo_name,
+            issue_number=pr_number,
+            installation_id=installation_id,
+            progress_comment_id=progress_comment_id,
+            trigger_comment_id=comment.id,
+            is_review_comment=True,
+        )
+        self._track_session(session_id, state)
 
         request = BridgeSessionRequest(
             external_session_id=session_id,
@@ -554,50 +695,59 @@ class GitHubAdapter:
             prompt=full_prompt,
             agent_name=self._agent_name,
             descriptive_name=slugify(pr.title),
-            service_metadata=session_data,
+            service_metadata=state.to_metadata(),
             github_repo=repo.full_name,
             github_installation_id=installation_id,
         )
 
-        await self._session_manager.handle_new_session(self, request)
+        # The agent turn runs for minutes; don't hold a webhook worker for it
+        self._spawn_turn(self._session_manager.handle_new_session(self, request))
+
+    def _track_session(self, session_id: str, state: SessionState) -> None:
+        """Store a session's state, evicting the least recently used past the cap.
+
+        An evicted issue is treated as new on its next mention, which starts a
+        fresh session just as for an issue the bot has never seen.
+        """
+        self._sessions[session_id] = state
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > MAX_TRACKED_SESSIONS:
+            self._sessions.popitem(last=False)
+
+    def _get_session(self, session_id: str) -> SessionState | None:
+        """Look up a session's state and mark it as recently used."""
+        state = self._sessions.get(session_id)
+        if state is not None:
+            self._sessions.move_to_end(session_id)
+        return state
 
     async def send_update(self, session_id: str, update: BridgeUpdate) -> None:
-        """Translate BridgeUpdate to GitHub comment edits."""
-        session_data = self._sessions.get(session_id)
-        if not session_data:
+        """Translate BridgeUpdate to GitHub comment edits.
+
+        Progress edits are coalesced: the latest text is stored on the session and
+        written by a single PATCH at most every PROGRESS_EDIT_INTERVAL seconds.
+        """
+        state = self._get_session(session_id)
+        if state is None:
             logger.warning("No session data for %s, cannot send update", session_id)
             return
 
         try:
-            owner = session_data["owner"]
-            repo = session_data["repo"]
-            installation_id = session_data["installation_id"]
-            progress_id = session_data["progress_comment_id"]
-            is_review = session_data["is_review_comment"]
-
             if update.type == "thought":
                 new_text = f"_Thinking: {update.content}_"
-                await self._update_progress(
-                    owner, repo, progress_id, new_text, installation_id, is_review
-                )
-                session_data["current_text"] = new_text
 
             elif update.type == "tool_call":
-                current = session_data.get("current_text", "")
+                current = state.current_text
                 tool_name = update.content
                 locations = update.metadata.get("locations", [])
                 tool_line = f"\n- `{tool_name}`"
                 if locations:
                     tool_line += f" ({', '.join(locations)})"
                 new_text = current + tool_line
-                await self._update_progress(
-                    owner, repo, progress_id, new_text, installation_id, is_review
-                )
-                session_data["current_text"] = new_text
 
             elif update.type == "message_chunk":
-                self._message_buffers.setdefault(session_id, "")
-                self._message_buffers[session_id] += update.content
+                state.message_buffer += update.content
+                return
 
             elif update.type == "plan":
                 entries = update.metadata.get("entries", [])
@@ -607,34 +757,96 @@ class GitHubAdapter:
                     checkbox = "[x]" if status == "completed" else "[ ]"
                     plan_lines.append(f"- {checkbox} {entry.get('content', '')}")
                 new_text = "\n".join(plan_lines)
-                await self._update_progress(
-                    owner, repo, progress_id, new_text, installation_id, is_review
-                )
-                session_data["current_text"] = new_text
 
+            else:
+                return
+
+            # Repeated updates (e.g. an unchanged plan) need no edit; the text is
+            # already posted or waiting on the pending edit
+            if new_text == state.current_text:
+                return
+            state.current_text = new_text
+            self._schedule_progress_edit(session_id)
+
+        except Exception:
+            logger.exception("Error sending update to GitHub for %s", session_id)
+
+    def _schedule_progress_edit(self, session_id: str) -> None:
+        """Arm the edit timer for a session unless an edit is already pending or running.
+
+        A running edit re-arms the timer itself if the text changed while it was in
+        flight, so a session never has two PATCHes racing for its comment.
+        """
+        if session_id in self._pending_edits or session_id in self._edit_tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._pending_edits[session_id] = loop.call_later(
+            PROGRESS_EDIT_INTERVAL, self._on_edit_timer, session_id
+        )
+
+    def _on_edit_timer(self, session_id: str) -> None:
+        self._pending_edits.pop(session_id, None)
+        self._edit_tasks[session_id] = self._spawn(self._flush_progress(session_id))
+
+    async def _flush_progress(self, session_id: str) -> None:
+        """Write the session's latest progress text to its progress comment."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            self._edit_tasks.pop(session_id, None)
+            return
+        text = state.current_text
+        try:
+            await self._update_progress(
+                state.owner,
+                state.repo,
+                state.progress_comment_id,
+                text,
+                state.installation_id,
+                state.is_review_comment,
+            )
         except Exception:
             logger.exception("Error sending update to GitHub for %s", session_id)
+        finally:
+            self._edit_tasks.pop(session_id, None)
+        # Updates held back while this edit was in flight get the next one
+        if state.current_text != text:
+            self._schedule_progress_edit(session_id)
+
+    async def _drop_progress_edits(self, session_id: str) -> None:
+        """Cancel a pending edit and wait out one in flight before the final edit.
+
+        Otherwise a late progress PATCH could overwrite the final response.
+        """
+        task = self._edit_tasks.get(session_id)
+        if task is not None:
+            await asyncio.wait([task])
+        # Checked after the wait: the finished edit may have re-armed the timer
+        handle = self._pending_edits.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
 
     async def send_completion(self, session_id: str, message: str, session_url: str = "") -> None:
         """Send completion: final edit + rocket reaction."""
-        session_data = self._sessions.get(session_id)
-        if not session_data:
+        state = self._get_session(session_id)
+        if state is None:
             logger.warning("No session data for %s, cannot send completion", session_id)
             return
 
-        final_text = self._message_buffers.pop(session_id, "") or message
+        await self._drop_progress_edits(session_id)
+        final_text = state.message_buffer or message
+        state.message_buffer = ""
 
         # Append session viewer link if available
         if session_url:
             final_text += f"\n\n[View full session]({session_url})"
 
         try:
-            owner = session_data["owner"]
-            repo = session_data["repo"]
-            installation_id = session_data["installation_id"]
-            progress_id = session_data["progress_comment_id"]
-            trigger_id = session_data["trigger_comment_id"]
-            is_review = session_data["is_review_comment"]
+            owner = state.owner
+            repo = state.repo
+            installation_id = state.installation_id
+            progress_id = state.progress_comment_id
+            trigger_id = state.trigger_comment_id
+            is_review = state.is_review_comment
 
             # Update progress comment with final response
             await self._update_progress(
@@ -651,11 +863,11 @@ class GitHubAdapter:
                     installation_id,
                     is_review_comment=is_review,
                 )
-            elif session_data.get("trigger_issue_number"):
+            elif state.trigger_issue_number:
                 await self._api.create_issue_reaction(
                     owner,
                     repo,
-                    session_data["trigger_issue_number"],
+                    state.trigger_issue_number,
                     "rocket",
                     installation_id,
                 )
@@ -667,21 +879,22 @@ class GitHubAdapter:
 
     async def send_error(self, session_id: str, error: str) -> None:
         """Send error message in comment + confused reaction."""
-        session_data = self._sessions.get(session_id)
-        self._message_buffers.pop(session_id, None)
-
-        if not session_data:
+        state = self._get_session(session_id)
+        if state is None:
             logger.warning("No session data for %s, cannot send error", session_id)
             return
 
-        try:
-            owner = session_data["owner"]
-            repo = session_data["repo"]
-            installation_id = session_data["installation_id"]
-            progress_id = session_data["progress_comment_id"]
-            trigger_id = session_data["trigger_comment_id"]
-            is_review = session_data["is_review_comment"]
+        state.message_buffer = ""
 
+        try:
+            owner = state.owner
+            repo = state.repo
+            installation_id = state.installation_id
+            progress_id = state.progress_comment_id
+            trigger_id = state.trigger_comment_id
+            is_review = state.is_review_comment
+
+            await self._drop_progress_edits(session_id)
             error_text = f"**Error:** {error}"
             await self._update_progress(
                 owner, repo, progress_id, error_text, installation_id, is_review
@@ -697,11 +910,11 @@ class GitHubAdapter:
                     installation_id,
                     is_review_comment=is_review,
                 )
-            elif session_data.get("trigger_issue_number"):
+            elif state.trigger_issue_number:
                 await self._api.create_issue_reaction(
                     owner,
                     repo,
-                    session_data["trigger_issue_number"],
+                    state.trigger_issue_number,
                     "confused",
                     installation_id,
                 )
@@ -728,6 +941,26 @@ class GitHubAdapter:
 
     async def close(self) -> None:
         """Clean up resources."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # Turns end once the session manager stops their agents; let them post their
+        # final completion or error rather than cutting it off mid-request
+        if self._turn_tasks:
+            _, pending = await asyncio.wait(set(self._turn_tasks), timeout=TURN_SHUTDOWN_TIMEOUT)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        for handle in self._pending_edits.values():
+            handle.cancel()
+        self._pending_edits.clear()
+        # Stop remaining reactions and progress edits before their clients go away
+        tasks = {*self._background_tasks, *self._edit_tasks.values()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._edit_tasks.clear()
         await self._api.close()
         await self._auth.close()
         logger.info("GitHub adapter closed")
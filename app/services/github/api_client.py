@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -11,6 +12,18 @@ from app.services.github.auth import GitHubAuth
 
 logger = logging.getLogger(__name__)
 
+# Progress edits arrive in bursts separated by long agent turns; keep idle
+# connections around well past httpx's 5s default so bursts skip the TLS handshake.
+GITHUB_API_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# Cap on concurrent requests per client; GitHub's secondary rate limit penalizes
+# bursts of concurrent calls from one app by stalling all of them
+GITHUB_API_CONCURRENCY = 8
+
 
 class GitHubApiClient:
     """Async client for GitHub REST API.
@@ -28,13 +41,23 @@ class GitHubApiClient:
             base_url="https://api.github.com",
             headers={"Accept": "application/vnd.github+json"},
             timeout=30.0,
+            limits=GITHUB_API_LIMITS,
         )
+        self._semaphore = asyncio.Semaphore(GITHUB_API_CONCURRENCY)
 
     async def _headers(self, installation_id: int) -> dict[str, str]:
         """Get auth headers for an installation."""
         token = await self._auth.get_installation_token(installation_id)
         return {"Authorization": f"Bearer {token}"}
 
+    async def _request(
+        self, method: str, url: str, installation_id: int, **kwargs: Any
+    ) -> httpx.Response:
+        """Send an authenticated request, waiting for a free concurrency slot."""
+        headers = await self._headers(installation_id)
+        async with self._semaphore:
+            return await self._client.request(method, url, headers=headers, **kwargs)
+
     async def create_comment(
         self,
         owner: str,
@@ -47,10 +70,10 @@ class GitHubApiClient:
 
         POST /repos/{owner}/{repo}/issues/{issue_number}/comments
         """
-        headers = await self._headers(installation_id)
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             f"/repos/{owner}/{repo}/issues/{issue_number}/comments",
-            headers=headers,
+            installation_id,
             json={"body": body},
         )
         response.raise_for_status()
@@ -68,10 +91,10 @@ class GitHubApiClient:
 
         PATCH /repos/{owner}/{repo}/issues/comments/{comment_id}
         """
-        headers = await self._headers(installation_id)
-        response = await self._client.patch(
+        response = await self._request(
+            "PATCH",
             f"/repos/{owner}/{repo}/issues/comments/{comment_id}",
-            headers=headers,
+            installation_id,
             json={"body": body},
         )
         response.raise_for_status()
@@ -90,10 +113,10 @@ class GitHubApiClient:
 
         POST /repos/{owner}/{repo}/pulls/{pull_number}/comments/{comment_id}/replies
         """
-        headers = await self._headers(installation_id)
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             f"/repos/{owner}/{repo}/pulls/{pull_number}/comments/{comment_id}/replies",
-            headers=headers,
+            installation_id,
             json={"body": body},
         )
         response.raise_for_status()
@@ -111,10 +134,10 @@ class GitHubApiClient:
 
         PATCH /repos/{owner}/{repo}/pulls/comments/{comment_id}
         """
-        headers = await self._headers(installation_id)
-        response = await self._client.patch(
+        response = await self._request(
+            "PATCH",
             f"/repos/{owner}/{repo}/pulls/comments/{comment_id}",
-            headers=headers,
+            installation_id,
             json={"body": body},
         )
         response.raise_for_status()
@@ -135,15 +158,15 @@ class GitHubApiClient:
         For issue comments: POST /repos/{owner}/{repo}/issues/comments/{comment_id}/reactions
         For review comments: POST /repos/{owner}/{repo}/pulls/comments/{comment_id}/reactions
         """
-        headers = await self._headers(installation_id)
         if is_review_comment:
             url = f"/repos/{owner}/{repo}/pulls/comments/{comment_id}/reactions"
         else:
             url = f"/repos/{owner}/{repo}/issues/comments/{comment_id}/reactions"
 
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             url,
-            headers=headers,
+            installation_id,
             json={"content": reaction},
         )
         # 200 OK = already existed, 201 Created = new reaction — both are fine
@@ -167,10 +190,10 @@ class GitHubApiClient:
 
         GET /repos/{owner}/{repo}/issues/{issue_number}/comments
         """
-        headers = await self._headers(installation_id)
-        response = await self._client.get(
+        response = await self._request(
+            "GET",
             f"/repos/{owner}/{repo}/issues/{issue_number}/comments",
-            headers=headers,
+            installation_id,
             params={"per_page": per_page},
         )
         response.raise_for_status()
@@ -188,11 +211,11 @@ class GitHubApiClient:
 
         POST /repos/{owner}/{repo}/issues/{issue_number}/reactions
         """
-        headers = await self._headers(installation_id)
         url = f"/repos/{owner}/{repo}/issues/{issue_number}/reactions"
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             url,
-            headers=headers,
+            installation_id,
             json={"content": reaction},
         )
         if response.status_code not in (200, 201):
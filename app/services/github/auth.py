@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 
 import httpx
 import jwt
@@ -34,6 +37,9 @@ class GitHubAuth:
         self._app_id = app_id or settings.github_app_id
         self._private_key = private_key or settings.github_private_key
         self._token_cache: dict[int, InstallationToken] = {}
+        # One lock per installation, so concurrent cold-cache callers for the same
+        # installation share one request without blocking other installations
+        self._token_locks: dict[int, asyncio.Lock] = {}
         self._client = httpx.AsyncClient(
             base_url="https://api.github.com",
             headers={"Accept": "application/vnd.github+json"},
@@ -41,9 +47,9 @@ class GitHubAuth:
         )
         self._app_slug: str | None = None
 
-    @property
+    @cached_property
     def _private_key_bytes(self) -> bytes:
-        """Convert the PEM key string (with escaped newlines) to bytes."""
+        """Convert the PEM key string (with escaped newlines) to bytes, once per instance."""
         return self._private_key.replace("\\n", "\n").encode("utf-8")
 
     def _generate_jwt(self) -> str:
@@ -60,26 +66,41 @@ class GitHubAuth:
             algorithm="RS256",
         )
 
+    def _token_lock_for(self, installation_id: int) -> asyncio.Lock:
+        """Get (or lazily create) the lock serializing token minting for an installation."""
+        lock = self._token_locks.get(installation_id)
+        if lock is None:
+            lock = self._token_locks[installation_id] = asyncio.Lock()
+        return lock
+
     async def get_installation_token(self, installation_id: int) -> str:
         """Get an installation token, using cache if still valid."""
         cached = self._token_cache.get(installation_id)
         if cached and not cached.is_expired:
             return cached.token
 
-        token_jwt = self._generate_jwt()
-        response = await self._client.post(
-            f"/app/installations/{installation_id}/access_tokens",
-            headers={"Authorization": f"Bearer {token_jwt}"},
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        # GitHub returns expires_at as ISO 8601; parse to timestamp
-        # But we can also just cache for 55 minutes (tokens last 1 hour)
-        self._token_cache[installation_id] = InstallationToken(
-            token=data["token"],
-            expires_at=time.time() + 3300,  # 55 minutes
-        )
+        async with self._token_lock_for(installation_id):
+            # Another caller may have minted it while we waited
+            cached = self._token_cache.get(installation_id)
+            if cached and not cached.is_expired:
+                return cached.token
+
+            token_jwt = self._generate_jwt()
+            response = await self._client.post(
+                f"/app/installations/{installation_id}/access_tokens",
+                headers={"Authorization": f"Bearer {token_jwt}"},
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            # GitHub returns expires_at as ISO 8601; fall back to 55 minutes (tokens last 1 hour)
+            try:
+                expires_at = datetime.fromisoformat(data["expires_at"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                expires_at = time.time() + 3300
+            self._token_cache[installation_id] = InstallationToken(
+                token=data["token"], expires_at=expires_at
+            )
 
         logger.info("Obtained new installation token for installation %d", installation_id)
         return data["token"]
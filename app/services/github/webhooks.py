@@ -9,11 +9,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def verify_signature(raw_body: bytes, signature_header: str, secret: str) -> bool:
+def verify_signature(raw_body: bytes, signature_header: str, secret: bytes | str) -> bool:
     """Verify GitHub webhook HMAC-SHA256 signature.
 
     The X-Hub-Signature-256 header contains 'sha256=<hex>' where <hex> is
     the HMAC-SHA256 digest of the raw request body signed with the webhook secret.
+    Callers on the hot path should pass the secret pre-encoded as bytes.
     """
     if not signature_header or not secret:
         return False
@@ -23,12 +24,12 @@ def verify_signature(raw_body: bytes, signature_header: str, secret: str) -> boo
     if not signature_header.startswith(prefix):
         return False
 
-    received_hex = signature_header[len(prefix) :]
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
 
-    expected = hmac.new(
-        secret.encode("utf-8"),
-        raw_body,
-        hashlib.sha256,
-    ).hexdigest()
+    expected = hmac.new(secret, raw_body, hashlib.sha256).hexdigest()
 
-    return hmac.compare_digest(expected, received_hex)
+    # Compare as bytes: compare_digest rejects non-ASCII str input
+    return hmac.compare_digest(
+        expected.encode("ascii"), signature_header[len(prefix) :].encode("utf-8")
+    )
@@ -50,6 +50,10 @@ class LinearAdapter:
         """No background tasks needed for webhook-based adapter."""
         pass
 
+    def restore_persisted_sessions(self) -> None:
+        """No persistent per-session state to rebuild for webhook-based adapter."""
+        pass
+
     def register_routes(self, app: FastAPI) -> None:
         """Register the Linear webhook endpoint."""
 
@@ -95,7 +95,9 @@ class SlackAdapter:
                     return
                 raise
 
-    async def _post_fallback_message(self, session_data: dict[str, Any], text: str) -> bool:
+    async def _post_fallback_message(
+        self, session_id: str, session_data: dict[str, Any], text: str
+    ) -> bool:
         channel = session_data["channel"]
         thread_ts = session_data.get("thread_ts")
         truncated = _truncate_for_slack(text, max_bytes=SLACK_RETRY_MAX_MESSAGE_BYTES)
@@ -108,6 +110,7 @@ class SlackAdapter:
             )
             session_data["progress_message_ts"] = response["ts"]
             session_data["current_text"] = truncated
+            self._session_manager.touch(session_id)
             return True
         except Exception:
             logger.exception("Failed to post fallback progress message for %s", channel)
@@ -135,17 +138,14 @@ class SlackAdapter:
 
     def restore_persisted_sessions(self) -> None:
         """Rebuild adapter state from sessions restored by the session manager."""
-        restored = self._session_manager.get_sessions_for_service(self.service_name)
-        for session_id, active in restored.items():
-            if active.service_metadata:
-                self._sessions[session_id] = active.service_metadata
-                channel = active.service_metadata.get("channel")
-                thread_ts = active.service_metadata.get("thread_ts")
-                if channel and thread_ts:
-                    self._active_threads.add((channel, thread_ts))
-                logger.debug(
-                    "Restored session %s with metadata: %s", session_id, active.service_metadata
-                )
+        restored = self._session_manager.get_service_metadata_for_service(self.service_name)
+        for session_id, metadata in restored.items():
+            self._sessions[session_id] = metadata
+            channel = metadata.get("channel")
+            thread_ts = metadata.get("thread_ts")
+            if channel and thread_ts:
+                self._active_threads.add((channel, thread_ts))
+            logger.debug("Restored session %s with metadata: %s", session_id, metadata)
         if restored:
             logger.info("Restored %d Slack session(s) from persistence", len(restored))
             logger.info("Active sessions after restore: %s", list(self._sessions.keys()))
@@ -435,6 +435,7 @@ class SlackAdapter:
             # Update existing session data with new progress message
             self._sessions[session_id]["progress_message_ts"] = progress_ts
             self._sessions[session_id]["current_text"] = "🤔 Thinking..."
+            self._session_manager.touch(session_id)
         else:
             # Create new session tracking
             self._sessions[session_id] = {
@@ -476,7 +477,7 @@ class SlackAdapter:
                 new_text = _truncate_for_slack(new_text)
                 update_ok = await self._safe_update_message(channel, ts, new_text)
                 if not update_ok:
-                    await self._post_fallback_message(session_data, new_text)
+                    await self._post_fallback_message(session_id, session_data, new_text)
                 session_data["current_text"] = new_text
 
             elif update.type == "tool_call":
@@ -516,7 +517,7 @@ class SlackAdapter:
                 plan_text = _truncate_for_slack(plan_text)
                 update_ok = await self._safe_update_message(channel, ts, plan_text)
                 if not update_ok:
-                    await self._post_fallback_message(session_data, plan_text)
+                    await self._post_fallback_message(session_id, session_data, plan_text)
                 session_data["current_text"] = plan_text
 
         except Exception:
@@ -554,7 +555,7 @@ class SlackAdapter:
             # Update progress message with final response
             update_ok = await self._safe_update_message(channel, progress_ts, final_text)
             if not update_ok:
-                await self._post_fallback_message(session_data, final_text)
+                await self._post_fallback_message(session_id, session_data, final_text)
 
             # Add checkmark reaction to original mention
             await self._api.add_reaction(channel, original_ts, "white_check_mark")
@@ -588,7 +589,7 @@ class SlackAdapter:
             error_text = f"❌ Error: {error}"
             update_ok = await self._safe_update_message(channel, progress_ts, error_text)
             if not update_ok:
-                await self._post_fallback_message(session_data, error_text)
+                await self._post_fallback_message(session_id, session_data, error_text)
 
             # Add X reaction to original mention
             await self._api.add_reaction(channel, original_ts, "x")